@@ -2,8 +2,18 @@
 FastAPI application for cleaning and standardizing ecommerce product data.
 """
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Optional
+
+import orjson
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, Response
+from pydantic import ValidationError
 
 from app.schemas import (
     TitleCleanRequest,
@@ -15,17 +25,172 @@ from app.schemas import (
 )
 from app.utils import (
     clean_title,
+    clean_all,
     parse_price,
     parse_rating,
-    make_slug,
-    extract_tags,
 )
+from app.workers import clean_chunk
+
+
+# Bulk requests larger than this are split across worker processes
+BULK_POOL_THRESHOLD = 512
+
+# Start pool workers from a forkserver rather than forking the server
+# process directly: the server runs threads (the threadpool and event loop),
+# and forking a threaded process can deadlock the child. The forkserver
+# preloads the cleaning modules so new workers do not have to import them.
+# Windows falls back to the default method.
+if "forkserver" in multiprocessing.get_all_start_methods():
+    _MP_CONTEXT = multiprocessing.get_context("forkserver")
+    _MP_CONTEXT.set_forkserver_preload(["app.workers"])
+else:
+    _MP_CONTEXT = None
+
+# /clean/bulk parses its body by hand, so its request schema is documented
+# explicitly. ProductInput is already registered by /clean/product.
+_BULK_REQUEST_SCHEMA = BulkCleanRequest.model_json_schema(
+    ref_template="#/components/schemas/{model}"
+)
+_BULK_REQUEST_SCHEMA.pop("$defs", None)
+
+
+def _bulk_pool_size() -> int:
+    """
+    Number of processes in the bulk cleaning pool of each server process.
+    
+    BULK_POOL_WORKERS overrides it. By default the CPUs are split evenly
+    between the uvicorn workers given by WEB_CONCURRENCY.
+    """
+    if os.environ.get("BULK_POOL_WORKERS"):
+        return int(os.environ["BULK_POOL_WORKERS"])
+    
+    server_workers = int(os.environ.get("WEB_CONCURRENCY") or 1)
+    return max(1, (os.cpu_count() or 1) // max(1, server_workers))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start the bulk worker pool with the app and shut it down on exit."""
+    pool_size = _bulk_pool_size()
+    pool = None
+    if pool_size > 1:
+        pool = ProcessPoolExecutor(max_workers=pool_size, mp_context=_MP_CONTEXT)
+    
+    app.state.bulk_pool = pool
+    app.state.bulk_pool_size = pool_size
+    try:
+        yield
+    finally:
+        app.state.bulk_pool = None
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+
+def _parse_bulk_body(body: bytes) -> tuple[list[str], list[str], list[str]]:
+    """
+    Split a raw /clean/bulk body into title, price and rating lists.
+    
+    Stands in for validating every item through ProductInput, which is
+    costly for large batches. Well-formed bodies only get cheap type
+    checks; anything else is validated with BulkCleanRequest so the 422
+    response has FastAPI's usual list of errors.
+    
+    Raises:
+        RequestValidationError: If the body does not match BulkCleanRequest
+    """
+    try:
+        products = orjson.loads(body)["products"]
+        if type(products) is list:
+            titles = [p["title"] for p in products]
+            prices = [p["price"] for p in products]
+            ratings = [p["rating"] for p in products]
+            categories = [p["category"] for p in products]
+            
+            if all(
+                type(v) is str
+                for values in (titles, prices, ratings, categories)
+                for v in values
+            ):
+                return titles, prices, ratings
+    except (orjson.JSONDecodeError, KeyError, TypeError):
+        pass
+    
+    # Invalid body, or one the cheap checks do not cover: report it the way
+    # FastAPI does for a BulkCleanRequest parameter
+    try:
+        data = orjson.loads(body)
+    except orjson.JSONDecodeError as exc:
+        raise RequestValidationError(
+            [
+                {
+                    "type": "json_invalid",
+                    "loc": ("body", exc.pos),
+                    "msg": "JSON decode error",
+                    "input": {},
+                    "ctx": {"error": exc.msg},
+                }
+            ]
+        )
+    
+    try:
+        request = BulkCleanRequest.model_validate(data, from_attributes=True)
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [
+                {**error, "loc": ("body", *error["loc"])}
+                for error in exc.errors(include_url=False)
+            ]
+        )
+    
+    return (
+        [p.title for p in request.products],
+        [p.price for p in request.products],
+        [p.rating for p in request.products],
+    )
+
+
+def _clean_bulk_body(
+    body: bytes,
+    pool: Optional[ProcessPoolExecutor],
+    pool_size: int,
+) -> Response:
+    """
+    Clean a raw /clean/bulk body and return the cleaned products as JSON.
+    
+    Large batches are spread across pool when one is given; otherwise
+    everything is cleaned in the calling thread.
+    """
+    titles, prices, ratings = _parse_bulk_body(body)
+    
+    if pool is not None and len(titles) > BULK_POOL_THRESHOLD:
+        # Large batches are CPU-bound, so spread them across processes
+        chunk_size = -(-len(titles) // pool_size)
+        futures = [
+            pool.submit(
+                clean_chunk,
+                titles[i:i + chunk_size],
+                prices[i:i + chunk_size],
+                ratings[i:i + chunk_size],
+            )
+            for i in range(0, len(titles), chunk_size)
+        ]
+        cleaned_products = [item for f in futures for item in f.result()]
+    else:
+        cleaned_products = clean_chunk(titles, prices, ratings)
+    
+    # Values come straight from our own utils, so skip response model
+    # validation and encode the payload directly
+    return Response(
+        content=orjson.dumps({"products": cleaned_products}),
+        media_type="application/json",
+    )
 
 
 app = FastAPI(
     title="Product Cleaner API",
     description="Clean and standardize ecommerce product data",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 
@@ -44,7 +209,7 @@ async def root():
 
 
 @app.post("/clean/title", response_model=TitleCleanResponse)
-async def clean_product_title(request: TitleCleanRequest):
+def clean_product_title(request: TitleCleanRequest):
     """
     Clean a product title by removing extra whitespace and applying Title Case.
     
@@ -63,7 +228,7 @@ async def clean_product_title(request: TitleCleanRequest):
 
 
 @app.post("/clean/product", response_model=ProductCleaned)
-async def clean_product(product: ProductInput):
+def clean_product(product: ProductInput):
     """
     Clean and standardize a complete product record.
     
@@ -95,17 +260,13 @@ async def clean_product(product: ProductInput):
             "tags": ["eco", "friendly", "bottle", "500ml", "green"]
         }
     """
-    # Clean the title
-    title_cleaned = clean_title(product.title)
+    # Clean the title and generate slug and tags in one pass
+    title_cleaned, slug, tags = clean_all(product.title)
     
     # Parse price and rating
     price_val = parse_price(product.price)
     rating_val = parse_rating(product.rating)
     
-    # Generate slug and tags from cleaned title
-    slug = make_slug(title_cleaned)
-    tags = extract_tags(title_cleaned)
-    
     return ProductCleaned(
         title_clean=title_cleaned,
         price_value=price_val,
@@ -115,18 +276,27 @@ async def clean_product(product: ProductInput):
     )
 
 
-@app.post("/clean/bulk", response_model=BulkCleanResponse)
-async def clean_bulk_products(request: BulkCleanRequest):
+@app.post(
+    "/clean/bulk",
+    responses={200: {"model": BulkCleanResponse}},
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _BULK_REQUEST_SCHEMA}},
+        },
+    },
+)
+async def clean_bulk_products(request: Request):
     """
     Clean multiple products in a single request.
     
     Applies the same cleaning logic as /clean/product to each item in the list.
     
     Args:
-        request: BulkCleanRequest containing list of products
+        request: Raw request whose JSON body matches BulkCleanRequest
         
     Returns:
-        BulkCleanResponse with list of cleaned products
+        JSON response shaped like BulkCleanResponse, encoded with orjson
         
     Example:
         Input: {
@@ -142,31 +312,14 @@ async def clean_bulk_products(request: BulkCleanRequest):
             ]
         }
     """
-    cleaned_products = []
+    body = await request.body()
     
-    for product in request.products:
-        # Clean the title
-        title_cleaned = clean_title(product.title)
-        
-        # Parse price and rating
-        price_val = parse_price(product.price)
-        rating_val = parse_rating(product.rating)
-        
-        # Generate slug and tags
-        slug = make_slug(title_cleaned)
-        tags = extract_tags(title_cleaned)
-        
-        cleaned_products.append(
-            ProductCleaned(
-                title_clean=title_cleaned,
-                price_value=price_val,
-                rating_value=rating_val,
-                slug=slug,
-                tags=tags,
-            )
-        )
+    # The pool only exists while the app's lifespan is running
+    pool = getattr(request.app.state, "bulk_pool", None)
+    pool_size = getattr(request.app.state, "bulk_pool_size", 1)
     
-    return BulkCleanResponse(products=cleaned_products)
+    # Parsing and cleaning are CPU-bound, so keep them off the event loop
+    return await run_in_threadpool(_clean_bulk_body, body, pool, pool_size)
 
 
 @app.exception_handler(Exception)
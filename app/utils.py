@@ -4,14 +4,44 @@ All functions are pure - no FastAPI dependencies.
 """
 
 import re
+from functools import lru_cache
 from typing import Optional
 
 
 # Common stopwords to filter out from tags
-STOPWORDS = {
+STOPWORDS = frozenset({
     "the", "and", "or", "but", "in", "on", "at", "to", "for",
     "of", "with", "a", "an", "is", "it", "this", "that"
-}
+})
+
+# Pre-compiled patterns used by the cleaning functions below
+_WS_RE = re.compile(r'\s+')
+_PRICE_STRIP_RE = re.compile(r'[^\d.]')
+# Matches "X", "X out of Y" and "X/Y" ratings in a single scan
+_RATING_RE = re.compile(
+    r'(?P<num>[\d.]+)\s*(?:out\s*of\s*[\d.]+|/\s*(?P<frac>[\d.]+))?',
+    re.IGNORECASE,
+)
+_SLUG_DEDUP_RE = re.compile(r'-+')
+# Letters that str.title() capitalizes after a digit or apostrophe
+_TITLE_LOWER_RE = re.compile(r"(?<=[\d'’])[^\W\d_]+")
+
+# ASCII bytes to delete when filtering slugs and tags with bytes.translate.
+# Encoding with errors='ignore' drops everything outside ASCII first.
+_SLUG_CHARS = b"abcdefghijklmnopqrstuvwxyz0123456789-"
+_SLUG_DELETE = bytes(c for c in range(128) if c not in _SLUG_CHARS)
+_TAG_DELETE = _SLUG_DELETE + b"-"
+_WORDS_DELETE = _SLUG_DELETE.replace(b" ", b"")
+_PRICE_DELETE = bytes(c for c in range(128) if c not in b"0123456789.")
+
+# Non-ASCII currency symbols handled by the parse_price fast path
+_PRICE_SYMBOLS = frozenset("₹€£¥")
+
+# Titles longer than this skip the clean_all cache
+_MAX_CACHED_TITLE_LENGTH = 256
+
+# Below this many candidate tags, dedupe with a list scan instead of hashing
+_SMALL_TAG_COUNT = 16
 
 
 def clean_title(raw_title: str) -> str:
@@ -28,20 +58,32 @@ def clean_title(raw_title: str) -> str:
     Examples:
         >>> clean_title("  eco   friendly bottle  ")
         'Eco Friendly Bottle'
+        >>> clean_title("bottle 500ml")
+        'Bottle 500ml'
+        >>> clean_title("men's t-shirt")
+        "Men's T-Shirt"
     """
     if not raw_title:
         return ""
     
-    # Strip leading/trailing whitespace
-    title = raw_title.strip()
-    
-    # Collapse multiple spaces into one
-    title = re.sub(r'\s+', ' ', title)
-    
-    # Convert to Title Case
-    title = title.title()
+    # Strip and collapse whitespace, then convert to Title Case
+    return _title_case(" ".join(raw_title.split()))
+
+
+def _title_case(text: str) -> str:
+    """
+    Apply str.title(), but keep letters after digits and apostrophes lowercase.
     
-    return title
+    str.title() starts a new word after any non-letter, which turns "500ml"
+    into "500Ml" and "men's" into "Men'S". Word starts after hyphens,
+    slashes, brackets and other punctuation are kept ("T-Shirt").
+    """
+    return _TITLE_LOWER_RE.sub(_lower_match, text.title())
+
+
+def _lower_match(match: re.Match) -> str:
+    """Lowercase the text matched by a regex."""
+    return match.group().lower()
 
 
 def parse_price(price_str: str) -> Optional[float]:
@@ -68,7 +110,15 @@ def parse_price(price_str: str) -> Optional[float]:
     try:
         # Remove currency symbols, commas, and text
         # Keep only digits and decimal point
-        cleaned = re.sub(r'[^\d.]', '', price_str)
+        if price_str.isascii():
+            cleaned = price_str.encode().translate(None, _PRICE_DELETE)
+        else:
+            # Well-formed prices with a known symbol skip the regex strip
+            price = _parse_symbol_price(price_str)
+            if price is not None:
+                return price
+            
+            cleaned = _PRICE_STRIP_RE.sub('', price_str)
         
         if not cleaned:
             return None
@@ -78,6 +128,57 @@ def parse_price(price_str: str) -> Optional[float]:
         return None
 
 
+def _parse_symbol_price(price_str: str) -> Optional[float]:
+    """
+    Parse prices like "₹1,299.50" without the regex strip.
+    
+    Returns None when the string does not start with a known currency
+    symbol, or when anything other than digits, commas and one decimal
+    point follows it, in which case parse_price uses the regex instead.
+    """
+    if price_str[:1] not in _PRICE_SYMBOLS:
+        return None
+    
+    digits = price_str[1:].strip().replace(',', '')
+    if not digits.replace('.', '', 1).isdecimal():
+        return None
+    
+    return float(digits)
+
+
+def parse_prices_bulk(prices: list[str]) -> list[Optional[float]]:
+    """
+    Parse a list of price strings, applying the same rules as parse_price.
+    
+    ASCII prices are stripped with bytes.translate inside a single loop;
+    anything else goes through parse_price.
+    
+    Args:
+        prices: List of price strings
+        
+    Returns:
+        List of parsed prices, with None where parsing fails
+        
+    Examples:
+        >>> parse_prices_bulk(["$12.50", "₹499", "N/A"])
+        [12.5, 499.0, None]
+    """
+    values = []
+    append = values.append
+    
+    for price_str in prices:
+        if price_str and isinstance(price_str, str) and price_str.isascii():
+            cleaned = price_str.encode().translate(None, _PRICE_DELETE)
+            try:
+                append(float(cleaned) if cleaned else None)
+            except ValueError:
+                append(None)
+        else:
+            append(parse_price(price_str))
+    
+    return values
+
+
 def parse_rating(rating_str: str) -> Optional[float]:
     """
     Parse a rating string to extract numeric value between 0 and 5.
@@ -100,29 +201,20 @@ def parse_rating(rating_str: str) -> Optional[float]:
         return None
     
     try:
-        # Try to match "X out of Y" format
-        match = re.search(r'([\d.]+)\s*out\s*of\s*[\d.]+', rating_str, re.IGNORECASE)
-        if match:
-            rating = float(match.group(1))
-            return min(max(rating, 0.0), 5.0)  # Clamp between 0 and 5
-        
-        # Try to match "X/Y" format
-        match = re.search(r'([\d.]+)\s*/\s*([\d.]+)', rating_str)
-        if match:
-            numerator = float(match.group(1))
-            denominator = float(match.group(2))
+        # Find the first number and whether it is "X out of Y" or "X/Y"
+        match = _RATING_RE.search(rating_str)
+        if not match:
+            return None
+        
+        rating = float(match.group('num'))
+        
+        if match.group('frac') is not None:
+            denominator = float(match.group('frac'))
             if denominator > 0:
                 # Normalize to 5-point scale
-                rating = (numerator / denominator) * 5.0
-                return min(max(rating, 0.0), 5.0)
-        
-        # Try to extract just a number
-        match = re.search(r'[\d.]+', rating_str)
-        if match:
-            rating = float(match.group())
-            return min(max(rating, 0.0), 5.0)
+                rating = (rating / denominator) * 5.0
         
-        return None
+        return min(max(rating, 0.0), 5.0)  # Clamp between 0 and 5
     except (ValueError, AttributeError):
         return None
 
@@ -149,13 +241,13 @@ def make_slug(title: str) -> str:
     slug = title.lower()
     
     # Replace spaces with hyphens
-    slug = re.sub(r'\s+', '-', slug)
+    slug = _WS_RE.sub('-', slug)
     
     # Keep only alphanumeric and hyphens
-    slug = re.sub(r'[^a-z0-9-]', '', slug)
+    slug = slug.encode('ascii', 'ignore').translate(None, _SLUG_DELETE).decode()
     
     # Remove consecutive hyphens
-    slug = re.sub(r'-+', '-', slug)
+    slug = _SLUG_DEDUP_RE.sub('-', slug)
     
     # Strip leading/trailing hyphens
     slug = slug.strip('-')
@@ -188,7 +280,7 @@ def extract_tags(title: str) -> list[str]:
     tags = []
     for word in words:
         # Remove non-alphanumeric characters
-        clean_word = re.sub(r'[^a-z0-9]', '', word)
+        clean_word = word.encode('ascii', 'ignore').translate(None, _TAG_DELETE).decode()
         
         # Keep if it's not a stopword and has content
         if clean_word and clean_word not in STOPWORDS:
@@ -203,3 +295,69 @@ def extract_tags(title: str) -> list[str]:
             unique_tags.append(tag)
     
     return unique_tags
+
+
+def clean_all(raw_title: str) -> tuple[str, str, tuple[str, ...]]:
+    """
+    Produce the clean title, slug and tags for a raw title in a single pass.
+    
+    Equivalent to calling clean_title, then make_slug and extract_tags on the
+    result, but does the work as a few whole-string operations instead of
+    per-word Python loops. Results for titles up to _MAX_CACHED_TITLE_LENGTH
+    characters are cached, since product feeds repeat the same title across
+    SKUs; tags are returned as a tuple so cached results cannot be mutated.
+    
+    Args:
+        raw_title: The raw product title string
+        
+    Returns:
+        Tuple of (clean title, slug, tags)
+        
+    Examples:
+        >>> clean_all("  eco   friendly bottle  ")
+        ('Eco Friendly Bottle', 'eco-friendly-bottle', ('eco', 'friendly', 'bottle'))
+    """
+    if not raw_title:
+        return "", "", ()
+    
+    # Keep long titles out of the cache to bound its memory use
+    if len(raw_title) > _MAX_CACHED_TITLE_LENGTH:
+        return _clean_all(raw_title)
+    
+    return _clean_all_cached(raw_title)
+
+
+def _clean_all(raw_title: str) -> tuple[str, str, tuple[str, ...]]:
+    """Uncached implementation of clean_all for a non-empty title."""
+    # Same rules as clean_title
+    title = _title_case(" ".join(raw_title.split()))
+    
+    # Keep only alphanumeric, hyphens and the separating spaces
+    words = (
+        title.lower()
+        .encode('ascii', 'ignore')
+        .translate(None, _WORDS_DELETE)
+        .decode()
+    )
+    
+    slug = _SLUG_DEDUP_RE.sub('-', '-'.join(words.split())).strip('-')
+    
+    # Tags are the slug words without hyphens, minus stopwords and repeats
+    candidates = [
+        tag for tag in words.replace('-', '').split() if tag not in STOPWORDS
+    ]
+    if len(candidates) < _SMALL_TAG_COUNT:
+        # A linear scan beats hashing for the few tags a typical title has
+        unique_tags = []
+        for tag in candidates:
+            if tag not in unique_tags:
+                unique_tags.append(tag)
+        tags = tuple(unique_tags)
+    else:
+        tags = tuple(dict.fromkeys(candidates))
+    
+    return title, slug, tags
+
+
+# Bounded so client-supplied titles cannot grow the cache without limit
+_clean_all_cached = lru_cache(maxsize=16384)(_clean_all)
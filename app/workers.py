@@ -0,0 +1,46 @@
+"""
+Worker functions for cleaning batches of products.
+Kept free of FastAPI imports so they can run in a process pool.
+"""
+
+from app.utils import clean_all, parse_prices_bulk, parse_rating
+
+
+def clean_chunk(
+    titles: list[str],
+    prices: list[str],
+    ratings: list[str],
+) -> list[dict]:
+    """
+    Clean a batch of products given as parallel title, price and rating lists.
+    
+    Each cleaner runs as one tight loop over its own column; the results
+    are then zipped back into product dicts.
+    
+    Args:
+        titles: Raw product titles
+        prices: Raw price strings, one per title
+        ratings: Raw rating strings, one per title
+        
+    Returns:
+        List of cleaned product dicts matching the ProductCleaned fields
+    """
+    # Clean the titles and generate slugs and tags in one pass
+    title_results = list(map(clean_all, titles))
+    
+    # Parse prices and ratings
+    price_values = parse_prices_bulk(prices)
+    rating_values = list(map(parse_rating, ratings))
+    
+    return [
+        {
+            "title_clean": title_cleaned,
+            "price_value": price_val,
+            "rating_value": rating_val,
+            "slug": slug,
+            "tags": tags,
+        }
+        for (title_cleaned, slug, tags), price_val, rating_val in zip(
+            title_results, price_values, rating_values
+        )
+    ]
@@ -1,28 +1,61 @@
-import pandas as pd
-import requests
+import asyncio
+import json
 
-# 1. Load CSV
-df = pd.read_csv('us-shein-mens_clothes-1891.csv')
+import httpx
+from pyarrow import csv as pacsv
+
+API_URL = "https://products-cleaner-api.onrender.com/clean/bulk"
+CHUNK_SIZE = 100 # Products per /clean/bulk request
+MAX_CONCURRENCY = 8 # Requests in flight at once
+
+# 1. Load only the CSV columns we need
+table = pacsv.read_csv(
+    'us-shein-mens_clothes-1891.csv',
+    convert_options=pacsv.ConvertOptions(
+        include_columns=['goods-title-link', 'price', 'rank-sub']
+    ),
+)
+table = table.slice(0, 50) # Testing with first 50 rows
 
 # 2. Map CSV columns to your JSON Schema
-products = []
-for _, row in df.head(50).iterrows(): # Testing with first 50 rows
-    products.append({
-        "title": str(row['goods-title-link']),
-        "price": str(row['price']),
+products = [
+    {
+        "title": str(title),
+        "price": str(price),
         "rating": "0", # CSV lacks ratings, providing default
-        "category": str(row['rank-sub']) if pd.notna(row['rank-sub']) else "Men's Fashion"
-    })
+        "category": rank_sub or "Men's Fashion"
+    }
+    for title, price, rank_sub in zip(
+        table.column('goods-title-link').to_pylist(),
+        table.column('price').to_pylist(),
+        table.column('rank-sub').to_pylist(),
+    )
+]
 
-# 3. Send to API
-response = requests.post(
-    "https://products-cleaner-api.onrender.com/clean/bulk",
-    json={"products": products}
-)
 
-# 4. Save the Cleaned JSON result
-if response.status_code == 200:
+async def post_chunk(client, semaphore, chunk):
+    async with semaphore:
+        response = await client.post(API_URL, json={"products": chunk})
+        response.raise_for_status()
+        return response.json()["products"]
+
+
+async def main():
+    chunks = [products[i:i + CHUNK_SIZE] for i in range(0, len(products), CHUNK_SIZE)]
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+
+    # 3. Send chunks to the API concurrently over one shared connection pool
+    async with httpx.AsyncClient(timeout=60) as client:
+        results = await asyncio.gather(
+            *[post_chunk(client, semaphore, chunk) for chunk in chunks]
+        )
+
+    # 4. Save the Cleaned JSON result, keeping the original order
+    cleaned = [product for chunk in results for product in chunk]
     with open('cleaned_products.json', 'w') as f:
-        f.write(response.text)
+        json.dump({"products": cleaned}, f)
 
     print("Done! Check cleaned_products.json")
+
+
+asyncio.run(main())
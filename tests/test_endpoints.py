@@ -0,0 +1,207 @@
+"""
+Tests for the Product Cleaner API endpoints.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import workers
+from app.main import app
+
+
+client = TestClient(app)
+
+
+def make_products(count: int) -> list[dict]:
+    """Build a list of raw products for bulk requests."""
+    return [
+        {"title": f"item {i}", "price": f"${i}", "rating": "4/5", "category": "Tools"}
+        for i in range(count)
+    ]
+
+
+def test_bulk_pool_survives_lifespan_restart(monkeypatch):
+    """A new lifespan cycle starts a fresh pool for large bulk requests."""
+    monkeypatch.setenv("BULK_POOL_WORKERS", "2")
+    products = make_products(600)
+    
+    for _ in range(2):
+        with TestClient(app) as client:
+            response = client.post("/clean/bulk", json={"products": products})
+            
+            assert response.status_code == 200
+            cleaned = response.json()["products"]
+            assert len(cleaned) == 600
+            assert [p["price_value"] for p in cleaned] == [float(i) for i in range(600)]
+
+
+@pytest.mark.parametrize(
+    "raw_title, expected",
+    [
+        ("  eco   friendly bottle  ", "Eco Friendly Bottle"),
+        ("bottle 500ml green", "Bottle 500ml Green"),
+        ("men's shirt", "Men's Shirt"),
+        ("short sleeve t-shirt", "Short Sleeve T-Shirt"),
+        ("(plus size) spring/summer tee", "(Plus Size) Spring/Summer Tee"),
+    ],
+)
+def test_clean_title(raw_title, expected):
+    """Titles get Title Case, without capitals after digits or apostrophes."""
+    response = client.post("/clean/title", json={"raw_title": raw_title})
+    
+    assert response.status_code == 200
+    assert response.json() == {"clean_title": expected}
+
+
+def test_bulk_cleaning_error_returns_500(monkeypatch):
+    """Errors while cleaning happen before the streamed 200 is started."""
+    def broken_parse_rating(rating_str):
+        raise RuntimeError("boom")
+    
+    monkeypatch.setattr(workers, "parse_rating", broken_parse_rating)
+    failing_client = TestClient(app, raise_server_exceptions=False)
+    
+    response = failing_client.post("/clean/bulk", json={"products": make_products(2)})
+    
+    assert response.status_code == 500
+    assert response.json() == {"detail": "Internal server error occurred"}
+
+
+@pytest.mark.parametrize(
+    "rating, expected",
+    [
+        ("4.2 out of 5", 4.2),
+        ("4/5", 4.0),
+        ("3 / 10", 1.5),
+        ("4/0", 4.0),
+        ("4.5", 4.5),
+        ("no rating", None),
+        # Only the first number and its suffix are used
+        ("100% (4/5)", 5.0),
+        ("120 reviews, 4.5 out of 5", 5.0),
+    ],
+)
+def test_clean_product_rating(rating, expected):
+    """Ratings are normalized to a 0-5 scale from the first number found."""
+    product = {"title": "widget", "price": "$10", "rating": rating, "category": "Tools"}
+    
+    response = client.post("/clean/product", json=product)
+    
+    assert response.status_code == 200
+    assert response.json()["rating_value"] == expected
+
+
+def test_clean_bulk():
+    """Bulk cleaning returns one cleaned product per input, in order."""
+    products = [
+        {"title": "widget a", "price": "$10", "rating": "5/5", "category": "Tools"},
+        {"title": "widget b", "price": "₹1,299", "rating": "4.5", "category": "Tools"},
+    ]
+    
+    response = client.post("/clean/bulk", json={"products": products})
+    
+    assert response.status_code == 200
+    assert response.json() == {
+        "products": [
+            {
+                "title_clean": "Widget A",
+                "price_value": 10.0,
+                "rating_value": 5.0,
+                "slug": "widget-a",
+                "tags": ["widget"],
+            },
+            {
+                "title_clean": "Widget B",
+                "price_value": 1299.0,
+                "rating_value": 4.5,
+                "slug": "widget-b",
+                "tags": ["widget", "b"],
+            },
+        ]
+    }
+
+
+def test_clean_bulk_empty_list():
+    """An empty product list is valid."""
+    response = client.post("/clean/bulk", json={"products": []})
+    
+    assert response.status_code == 200
+    assert response.json() == {"products": []}
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b"not json",
+        b"[]",
+        b"{}",
+        b'{"products": ""}',
+        b'{"products": {}}',
+        b'{"products": null}',
+        b'{"products": ["widget"]}',
+        b'{"products": [{"title": "widget", "price": "$10"}]}',
+    ],
+)
+def test_clean_bulk_malformed_body(body):
+    """Bodies that are not a list of products are rejected."""
+    response = client.post(
+        "/clean/bulk",
+        content=body,
+        headers={"Content-Type": "application/json"},
+    )
+    
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize("field", ["title", "price", "rating", "category"])
+@pytest.mark.parametrize("value", [None, 10, ["widget"]])
+def test_clean_bulk_non_string_field(field, value):
+    """Every product field must be a string."""
+    product = {"title": "widget", "price": "$10", "rating": "4/5", "category": "Tools"}
+    product[field] = value
+    
+    response = client.post("/clean/bulk", json={"products": [product]})
+    
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "products", 0, field]
+
+
+@pytest.mark.parametrize("field", ["title", "price", "rating", "category"])
+def test_clean_bulk_missing_field(field):
+    """A missing field is reported in FastAPI's usual error list."""
+    product = {"title": "widget", "price": "$10", "rating": "4/5", "category": "Tools"}
+    del product[field]
+    
+    response = client.post("/clean/bulk", json={"products": [product]})
+    
+    assert response.status_code == 422
+    assert response.json()["detail"] == [
+        {
+            "type": "missing",
+            "loc": ["body", "products", 0, field],
+            "msg": "Field required",
+            "input": product,
+        }
+    ]
+
+
+@pytest.mark.parametrize(
+    "title, slug, tags",
+    [
+        ("t--shirt -", "t-shirt", ["tshirt"]),
+        ("eco !!! bottle ... -- green", "eco-bottle-green", ["eco", "bottle", "green"]),
+        ("café ß", "caf-ss", ["caf", "ss"]),
+        ("the bottle of water with a lid", "the-bottle-of-water-with-a-lid", ["bottle", "water", "lid"]),
+        ("red shirt red RED shirt", "red-shirt-red-red-shirt", ["red", "shirt"]),
+        ("   ", "", []),
+    ],
+)
+def test_clean_product_slug_and_tags(title, slug, tags):
+    """Slugs keep stopwords and collapse hyphens; tags drop stopwords and repeats."""
+    product = {"title": title, "price": "$10", "rating": "4/5", "category": "Tools"}
+    
+    response = client.post("/clean/product", json=product)
+    
+    assert response.status_code == 200
+    assert response.json()["slug"] == slug
+    assert response.json()["tags"] == tags
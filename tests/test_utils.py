@@ -0,0 +1,94 @@
+"""
+Tests for the cleaning and parsing functions in app.utils.
+"""
+
+import re
+
+import pytest
+
+from app.utils import (
+    _clean_all_cached,
+    clean_all,
+    clean_title,
+    extract_tags,
+    make_slug,
+    parse_price,
+)
+
+
+TITLES = [
+    "  eco   friendly bottle 500ml green",
+    "t--shirt -",
+    "eco !!! bottle ... -- green",
+    "café ß",
+    "the bottle of water with a lid",
+    "red shirt red RED shirt",
+    "men's (plus size) spring/summer t-shirt",
+    "   ",
+    "",
+]
+
+
+@pytest.mark.parametrize("raw_title", TITLES)
+def test_clean_all_matches_separate_functions(raw_title):
+    """clean_all gives the same result as clean_title, make_slug and extract_tags."""
+    title = clean_title(raw_title)
+    
+    assert clean_all(raw_title) == (title, make_slug(title), tuple(extract_tags(title)))
+
+
+def test_clean_all_skips_cache_for_long_titles():
+    """Titles over 256 characters are cleaned without being cached."""
+    raw_title = " ".join(f"word{i}" for i in range(50))
+    assert len(raw_title) > 300
+    cache_size = _clean_all_cached.cache_info().currsize
+    
+    title, slug, tags = clean_all(raw_title)
+    
+    assert title == " ".join(f"Word{i}" for i in range(50))
+    assert slug == "-".join(f"word{i}" for i in range(50))
+    assert tags == tuple(f"word{i}" for i in range(50))
+    assert _clean_all_cached.cache_info().currsize == cache_size
+
+
+def test_clean_all_dedupes_tags_of_long_titles():
+    """Titles with many words keep the first occurrence of each tag, in order."""
+    raw_title = (
+        "red cotton shirt for men red slim fit cotton shirt with blue "
+        "buttons and a blue collar slim RED shirt summer cotton"
+    )
+    assert len(raw_title.split()) >= 20
+    
+    title, slug, tags = clean_all(raw_title)
+    
+    assert tags == (
+        "red", "cotton", "shirt", "men", "slim", "fit",
+        "blue", "buttons", "collar", "summer",
+    )
+    assert tags == tuple(extract_tags(title))
+
+
+@pytest.mark.parametrize(
+    "price_str, expected",
+    [
+        ("₹499", 499.0),
+        ("1,299 INR", 1299.0),
+        ("$12.50", 12.5),
+        ("₹1,299 approx", 1299.0),
+        ("€ 12.50", 12.5),
+        ("¥1000", 1000.0),
+        ("₹.", None),
+        ("£1.2.3", None),
+        ("free", None),
+        ("", None),
+    ],
+)
+def test_parse_price(price_str, expected):
+    """parse_price gives the same result as stripping everything but digits and dots."""
+    cleaned = re.sub(r"[^\d.]", "", price_str)
+    try:
+        old = float(cleaned) if cleaned else None
+    except ValueError:
+        old = None
+    
+    assert parse_price(price_str) == expected == old